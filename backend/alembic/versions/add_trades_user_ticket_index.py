@@ -0,0 +1,29 @@
+"""add unique index on trades (user_id, mt5_ticket)
+
+Revision ID: add_user_ticket_idx
+Revises: add_mt5_auto_source
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_user_ticket_idx'
+down_revision = 'add_mt5_auto_source'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lets the VPS sync service upsert with ON CONFLICT (user_id, mt5_ticket)
+    # instead of checking for existing tickets first. Manual trades have a
+    # NULL mt5_ticket, which never conflicts.
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_trades_user_ticket
+        ON trades (user_id, mt5_ticket)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ux_trades_user_ticket")
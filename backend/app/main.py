@@ -4,6 +4,7 @@ Main FastAPI application.
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -16,6 +17,7 @@ from app.routes.chat import router as chat_router
 from app.routes.mt5 import router as mt5_router
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.middleware.request_id import RequestIDMiddleware
+from app.middleware.gzip_request import GzipRequestMiddleware
 from app.utils.logging import setup_logging, get_logger
 
 # Setup logging
@@ -54,6 +56,10 @@ app.add_middleware(
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RequestIDMiddleware)
 
+# Compress large responses and inflate gzipped request bodies
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.add_middleware(GzipRequestMiddleware)
+
 # Add global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -0,0 +1,87 @@
+"""
+Gzip request body decompression middleware.
+"""
+import json
+import zlib
+
+# Hard cap on the inflated body size. Runs before authentication, so an
+# unbounded decompress would let a tiny crafted payload balloon into
+# gigabytes of memory (a classic zip bomb). 50 MB comfortably covers the
+# largest batch seeds.
+MAX_INFLATED_SIZE = 50 * 1024 * 1024
+
+
+class GzipRequestMiddleware:
+    """
+    Decompress request bodies sent with Content-Encoding: gzip.
+
+    Large batch payloads (e.g. POST /api/trades/batch) are highly repetitive
+    JSON that compresses 5-10x; this middleware inflates them before routing
+    so Pydantic validation sees plain JSON. Bodies are inflated incrementally
+    against MAX_INFLATED_SIZE: oversized payloads get a 413 and malformed
+    gzip gets a 400 instead of surfacing as a 500.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            headers = dict(scope["headers"])
+            if headers.get(b"content-encoding", b"").strip().lower() == b"gzip":
+                # wbits=16+MAX_WBITS -> gzip framing, same as gzip.decompress
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                chunks = []
+                inflated = 0
+                more_body = True
+                try:
+                    while more_body:
+                        message = await receive()
+                        chunk = decompressor.decompress(
+                            message.get("body", b""),
+                            MAX_INFLATED_SIZE + 1 - inflated
+                        )
+                        inflated += len(chunk)
+                        chunks.append(chunk)
+                        if inflated > MAX_INFLATED_SIZE or decompressor.unconsumed_tail:
+                            await self._reject(send, 413, "Decompressed request body too large")
+                            return
+                        more_body = message.get("more_body", False)
+                except zlib.error:
+                    await self._reject(send, 400, "Malformed gzip request body")
+                    return
+                body = b"".join(chunks)
+
+                # Rewrite the headers: the downstream app sees a plain body
+                scope = dict(scope)
+                scope["headers"] = [
+                    (key, value) for key, value in scope["headers"]
+                    if key not in (b"content-encoding", b"content-length")
+                ] + [(b"content-length", str(len(body)).encode())]
+
+                consumed = False
+
+                async def wrapped_receive():
+                    nonlocal consumed
+                    if not consumed:
+                        consumed = True
+                        return {"type": "http.request", "body": body, "more_body": False}
+                    return await receive()
+
+                await self.app(scope, wrapped_receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send, status: int, detail: str):
+        body = json.dumps({"detail": detail}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -302,13 +302,46 @@ def update_sync_status_from_vps(
     account = db.query(MT5Account).filter(MT5Account.id == update.account_id).first()
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
-    
+
     from datetime import timezone
     account.last_sync_at = datetime.now(timezone.utc)
     account.last_sync_status = update.status
     account.last_sync_message = update.message
     if update.last_trade_time:
         account.last_trade_time = update.last_trade_time
-    
+
+    db.commit()
+    return {"status": "updated"}
+
+
+@router.post("/vps/status/bulk")
+def update_sync_status_bulk_from_vps(
+    updates: List[VPSSyncStatusUpdate],
+    x_vps_secret: str = Header(...),
+    db: Session = Depends(get_db)
+):
+    """
+    Internal endpoint for VPS to update sync status for many accounts at once.
+    """
+    if x_vps_secret != VPS_SECRET:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid VPS secret"
+        )
+
+    from datetime import timezone
+    now = datetime.now(timezone.utc)
+
+    by_id = {update.account_id: update for update in updates}
+    accounts = db.query(MT5Account).filter(MT5Account.id.in_(by_id)).all()
+
+    for account in accounts:
+        update = by_id[account.id]
+        account.last_sync_at = now
+        account.last_sync_status = update.status
+        account.last_sync_message = update.message
+        if update.last_trade_time:
+            account.last_trade_time = update.last_trade_time
+
     db.commit()
-    return {"status": "updated"}
\ No newline at end of file
+    return {"status": "updated", "count": len(accounts)}
\ No newline at end of file
@@ -7,7 +7,14 @@ from typing import List, Optional
 from datetime import datetime
 
 from app.database import get_db
-from app.schemas import TradeCreate, TradeUpdate, TradeResponse, AnalyticsResponse
+from app.schemas import (
+    TradeCreate,
+    TradeUpdate,
+    TradeResponse,
+    TradeBatchCreate,
+    TradeBatchResponse,
+    AnalyticsResponse
+)
 from app.services.trade_service import TradeService
 from app.middleware.auth import get_current_user
 from app.models.user import User
@@ -45,6 +52,26 @@ async def create_trade(
     return trade
 
 
+@router.post("/batch", response_model=TradeBatchResponse, status_code=status.HTTP_201_CREATED)
+async def create_trades_batch(
+    batch: TradeBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Create many trades (each with an optional journal entry) in one request."""
+    trade_service = TradeService(db)
+
+    trade_ids = trade_service.create_trades_batch(
+        user_id=current_user.id,
+        items=[
+            (item.trade.model_dump(), item.journal.model_dump() if item.journal else None)
+            for item in batch.items
+        ]
+    )
+
+    return TradeBatchResponse(created=len(trade_ids), trade_ids=trade_ids)
+
+
 @router.get("", response_model=List[TradeResponse])
 async def get_trades(
     symbol: Optional[str] = None,
@@ -194,6 +194,23 @@ class JournalEntryResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TradeJournalItem(BaseModel):
+    """Schema for one trade plus optional journal entry in a batch."""
+    trade: TradeCreate
+    journal: Optional[JournalEntryCreate] = None
+
+
+class TradeBatchCreate(BaseModel):
+    """Schema for creating many trades (with journals) in one request."""
+    items: List[TradeJournalItem] = Field(..., min_length=1, max_length=500)
+
+
+class TradeBatchResponse(BaseModel):
+    """Schema for batch trade creation response."""
+    created: int
+    trade_ids: List[int]
+
+
 class TradeTagCreate(BaseModel):
     """Schema for creating trade tag."""
     name: str = Field(..., min_length=1, max_length=100)
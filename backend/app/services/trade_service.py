@@ -1,8 +1,9 @@
 """
 Trade service for managing trades and analytics.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+import json
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 from fastapi import HTTPException, status
@@ -107,6 +108,89 @@ class TradeService:
         
         return trade
     
+    def create_trades_batch(
+        self,
+        user_id: int,
+        items: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]
+    ) -> List[int]:
+        """
+        Create many manual trades, each with an optional journal entry,
+        in a single transaction.
+
+        Args:
+            user_id: User ID
+            items: List of (trade_fields, journal_fields) pairs
+
+        Returns:
+            List of created trade IDs, in input order
+        """
+        trades = []
+        for trade_fields, _ in items:
+            trade_type = trade_fields['trade_type']
+            volume = trade_fields['volume']
+            open_price = trade_fields['open_price']
+            close_price = trade_fields.get('close_price')
+            close_time = trade_fields.get('close_time')
+            profit = trade_fields.get('profit')
+            commission = trade_fields.get('commission', 0.0)
+            swap = trade_fields.get('swap', 0.0)
+
+            # Same derivations as create_manual_trade
+            if profit is None and close_price is not None:
+                if trade_type == TradeType.BUY:
+                    profit = (close_price - open_price) * volume
+                else:  # SELL
+                    profit = (open_price - close_price) * volume
+
+            net_profit = None
+            if profit is not None:
+                net_profit = profit - commission - swap
+
+            is_closed = trade_fields.get('is_closed')
+            if is_closed is None:
+                is_closed = close_price is not None and close_time is not None
+
+            trades.append(Trade(
+                user_id=user_id,
+                trade_source=TradeSource.MANUAL,
+                symbol=trade_fields['symbol'],
+                trade_type=trade_type,
+                volume=volume,
+                open_price=open_price,
+                close_price=close_price,
+                open_time=trade_fields['open_time'],
+                close_time=close_time,
+                stop_loss=trade_fields.get('stop_loss'),
+                take_profit=trade_fields.get('take_profit'),
+                profit=profit,
+                commission=commission,
+                swap=swap,
+                net_profit=net_profit,
+                is_closed=is_closed
+            ))
+
+        self.db.add_all(trades)
+        self.db.flush()  # assign trade IDs for the journal rows
+
+        journals = []
+        for (_, journal_fields), trade in zip(items, trades):
+            if not journal_fields:
+                continue
+            screenshot_urls = journal_fields.pop('screenshot_urls', None)
+            journals.append(JournalEntry(
+                user_id=user_id,
+                trade_id=trade.id,
+                screenshot_urls=json.dumps(screenshot_urls) if screenshot_urls else None,
+                **journal_fields
+            ))
+
+        if journals:
+            self.db.add_all(journals)
+
+        self.db.commit()
+
+        return [trade.id for trade in trades]
+
     def get_user_trades(
         self,
         user_id: int,
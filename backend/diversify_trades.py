@@ -0,0 +1,225 @@
+"""
+Script to diversify the demo account's sample trades across multiple symbols.
+Deletes the old single-symbol sample trades and regenerates them spread
+across ES, NQ, YM, GC and CL with symbol-appropriate prices and P&L.
+Run this from the backend directory: python diversify_trades.py
+"""
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select, func, case
+from app.database import SessionLocal
+from app.models.trade import Trade, TradeType, TradeSource
+from app.models.user import User
+
+DEMO_EMAIL = "admin@trading-journal.com"
+
+# Per-symbol market profile used to keep generated prices realistic
+SYMBOLS = {
+    'ES': {
+        'base_price': 4850.0, 'volatility': 12.0, 'drift_per_day': 1.5,
+        'point_value': 50.0, 'win_points': (4, 30), 'loss_points': (3, 15)
+    },
+    'NQ': {
+        'base_price': 17250.0, 'volatility': 45.0, 'drift_per_day': 6.0,
+        'point_value': 20.0, 'win_points': (15, 90), 'loss_points': (10, 45)
+    },
+    'YM': {
+        'base_price': 38500.0, 'volatility': 90.0, 'drift_per_day': 10.0,
+        'point_value': 5.0, 'win_points': (30, 200), 'loss_points': (20, 100)
+    },
+    'GC': {
+        'base_price': 2045.0, 'volatility': 6.0, 'drift_per_day': 0.8,
+        'point_value': 100.0, 'win_points': (2, 12), 'loss_points': (1, 6)
+    },
+    'CL': {
+        'base_price': 78.0, 'volatility': 0.9, 'drift_per_day': 0.1,
+        'point_value': 1000.0, 'win_points': (0.2, 1.5), 'loss_points': (0.1, 0.8)
+    },
+}
+
+# SoA view of SYMBOLS built once at import: contiguous arrays indexed by
+# symbol id, so the hot path reads scalars instead of hashing into a
+# string-keyed dict-of-dicts per field
+SYMBOL_KEYS = tuple(SYMBOLS)
+SYMBOL_IDX = {sym: i for i, sym in enumerate(SYMBOL_KEYS)}
+BASE_PRICES = np.array([SYMBOLS[s]['base_price'] for s in SYMBOL_KEYS])
+VOLATILITY = np.array([SYMBOLS[s]['volatility'] for s in SYMBOL_KEYS])
+DRIFT_PER_DAY = np.array([SYMBOLS[s]['drift_per_day'] for s in SYMBOL_KEYS])
+POINT_VALUES = np.array([SYMBOLS[s]['point_value'] for s in SYMBOL_KEYS])
+WIN_LO = np.array([SYMBOLS[s]['win_points'][0] for s in SYMBOL_KEYS])
+WIN_HI = np.array([SYMBOLS[s]['win_points'][1] for s in SYMBOL_KEYS])
+LOSS_LO = np.array([SYMBOLS[s]['loss_points'][0] for s in SYMBOL_KEYS])
+LOSS_HI = np.array([SYMBOLS[s]['loss_points'][1] for s in SYMBOL_KEYS])
+
+# How many trades each symbol gets (91 total)
+DISTRIBUTION = {'ES': 25, 'NQ': 22, 'YM': 16, 'GC': 15, 'CL': 13}
+
+WIN_RATE = 0.58
+COMMISSION_PER_CONTRACT = 2.25
+INSERT_CHUNK = 1000
+
+# Shared generator so categorical draws can be batched per symbol instead of
+# re-building the cumulative weight table on every random.choices() call
+RNG = np.random.default_rng()
+VOLUMES = np.array([1, 2, 3], dtype=np.int8)
+VOLUME_WEIGHTS = [0.7, 0.25, 0.05]
+
+
+def generate_prices(base_price: float, drift_per_day: float, volatility: float, days_offsets: np.ndarray) -> np.ndarray:
+    """Generate plausible prices at the given day offsets.
+
+    Takes the symbol constants directly - the caller already has the config
+    in scope, so the hot path avoids a dict lookup per batch.
+    """
+    return base_price + days_offsets * drift_per_day + RNG.normal(0, volatility, len(days_offsets))
+
+
+def make_symbol_rows(user_id: int, symbol: str, count: int, start_date: datetime) -> list:
+    """Build insertable row dicts for one symbol.
+
+    Prices, P&L and timestamps are computed as whole arrays; Python objects
+    are only materialized when the row dicts are assembled for executemany.
+    """
+    sid = SYMBOL_IDX[symbol]
+
+    # Draw the categorical vectors for the whole symbol batch in one go
+    volumes = RNG.choice(VOLUMES, size=count, p=VOLUME_WEIGHTS)
+    trade_types = np.where(RNG.integers(0, 2, count, dtype=np.int8) == 0, 'buy', 'sell')
+
+    days_offsets = RNG.uniform(0, 120, count)
+    open_times = (
+        pd.Timestamp(start_date)
+        + pd.to_timedelta(days_offsets, unit='D')
+        + pd.to_timedelta(RNG.uniform(0, 600, count), unit='m')
+    )
+    close_times = open_times + pd.to_timedelta(RNG.uniform(5, 300, count), unit='m')
+
+    open_prices = np.round(
+        generate_prices(BASE_PRICES[sid], DRIFT_PER_DAY[sid], VOLATILITY[sid], days_offsets), 2
+    )
+
+    wins = RNG.random(count) < WIN_RATE
+    points = np.where(
+        wins,
+        RNG.uniform(WIN_LO[sid], WIN_HI[sid], size=count),
+        -RNG.uniform(LOSS_LO[sid], LOSS_HI[sid], size=count)
+    )
+    direction = np.where(trade_types == 'buy', 1.0, -1.0)
+    close_prices = np.round(open_prices + direction * points, 2)
+
+    profits = np.round(points * POINT_VALUES[sid] * volumes, 2)
+    commissions = np.round(COMMISSION_PER_CONTRACT * volumes.astype(np.float64), 2)
+    net_profits = np.round(profits - commissions, 2)
+
+    open_py = open_times.to_pydatetime()
+    close_py = close_times.to_pydatetime()
+
+    rows = []
+    for i in range(count):
+        rows.append({
+            'user_id': user_id,
+            'trade_source': TradeSource.MANUAL,
+            'symbol': symbol,
+            'trade_type': TradeType.BUY if trade_types[i] == 'buy' else TradeType.SELL,
+            'volume': float(volumes[i]),
+            'open_price': float(open_prices[i]),
+            'close_price': float(close_prices[i]),
+            'open_time': open_py[i],
+            'close_time': close_py[i],
+            'profit': float(profits[i]),
+            'commission': float(commissions[i]),
+            'swap': 0.0,
+            'net_profit': float(net_profits[i]),
+            'is_closed': True
+        })
+    return rows
+
+
+def print_stats(db, user_id: int):
+    """Print summary statistics for the regenerated trades.
+
+    Uses aggregate SELECTs instead of hydrating Trade objects - the three
+    scalars and the winners/losers split come back as single rows.
+    """
+    total, wins, net = db.execute(
+        select(
+            func.count(),
+            func.sum(case((Trade.net_profit > 0, 1), else_=0)),
+            func.sum(Trade.net_profit)
+        ).where(Trade.user_id == user_id, Trade.is_closed == True)
+    ).one()
+
+    # One grouped SELECT gives gross profit and gross loss for profit factor
+    split = dict(db.execute(
+        select(Trade.net_profit > 0, func.sum(Trade.net_profit))
+        .where(Trade.user_id == user_id, Trade.is_closed == True)
+        .group_by(Trade.net_profit > 0)
+    ).all())
+
+    gross_profit = split.get(True, 0) or 0
+    gross_loss = abs(split.get(False, 0) or 0)
+
+    print("\n" + "=" * 60)
+    print("✓ Trades diversified successfully!")
+    print("=" * 60)
+    print(f"Total trades:  {total}")
+    print(f"Winners:       {wins} ({wins / total * 100:.1f}%)" if total else "Winners:       0")
+    print(f"Net P&L:       ${net:,.2f}")
+    if gross_loss > 0:
+        print(f"Profit factor: {gross_profit / gross_loss:.2f}")
+    print("=" * 60)
+
+
+def diversify_trades():
+    """Replace the demo user's sample trades with a multi-symbol set."""
+    db = SessionLocal()
+
+    try:
+        user = db.query(User).filter(User.email == DEMO_EMAIL).first()
+        if not user:
+            print(f"✗ User {DEMO_EMAIL} not found. Run create_admin.py first.")
+            return
+
+        # Drop the old sample trades before regenerating
+        deleted = db.query(Trade).filter(
+            Trade.user_id == user.id,
+            Trade.trade_source == TradeSource.MANUAL
+        ).delete()
+        print(f"Deleted {deleted} existing sample trades")
+
+        start_date = datetime.now(timezone.utc) - timedelta(days=120)
+
+        def gen_rows():
+            for symbol, count in DISTRIBUTION.items():
+                yield from make_symbol_rows(user.id, symbol, count, start_date)
+                print(f"Generated {count} {symbol} trades")
+
+        # Stream the rows into the insert in chunks instead of materializing
+        # the whole run - peak memory stays one symbol batch + one chunk
+        rows = gen_rows()
+        inserted = 0
+        while True:
+            chunk = list(islice(rows, INSERT_CHUNK))
+            if not chunk:
+                break
+            db.execute(Trade.__table__.insert(), chunk)
+            inserted += len(chunk)
+        db.commit()
+        print(f"Inserted {inserted} trades")
+
+        print_stats(db, user.id)
+
+    except Exception as e:
+        print(f"✗ Error diversifying trades: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    print("Diversifying sample trades...\n")
+    diversify_trades()
@@ -0,0 +1,155 @@
+"""
+Script to generate realistic NQ (Nasdaq 100 E-mini) sample trades for the
+demo account. Prices are tick-snapped and P&L uses the $20/point multiplier.
+Run this from the backend directory: python generate_nq_trades.py
+"""
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select, func, case
+from app.database import SessionLocal
+from app.models.trade import Trade, TradeType, TradeSource
+from app.models.user import User
+
+DEMO_EMAIL = "admin@trading-journal.com"
+
+NUM_TRADES = 80
+BASE_PRICE = 17250.0
+TICK = 0.25
+POINT_VALUE = 20.0
+DRIFT_PER_DAY = 6.0
+VOLATILITY = 45.0
+WIN_RATE = 0.55
+COMMISSION_PER_CONTRACT = 2.25
+
+# Shared generator so categorical draws can be batched instead of re-building
+# the cumulative weight table on every random.choices() call
+RNG = np.random.default_rng()
+VOLUMES = np.array([1, 2, 3], dtype=np.int8)
+VOLUME_WEIGHTS = [0.7, 0.25, 0.05]
+
+
+def snap_to_tick(prices: np.ndarray) -> np.ndarray:
+    """Snap prices to the nearest NQ tick (0.25)."""
+    return np.round(np.round(prices / TICK) * TICK, 2)
+
+
+def build_trade_rows(user_id: int, start_date: datetime, count: int) -> list:
+    """Build insertable NQ trade rows.
+
+    Prices, P&L and timestamps are computed as whole arrays; Python objects
+    are only materialized when the row dicts are assembled for executemany.
+    """
+    volumes = RNG.choice(VOLUMES, size=count, p=VOLUME_WEIGHTS)
+    trade_types = np.where(RNG.integers(0, 2, count, dtype=np.int8) == 0, 'buy', 'sell')
+
+    days_offsets = RNG.uniform(0, 120, count)
+    open_times = (
+        pd.Timestamp(start_date)
+        + pd.to_timedelta(days_offsets, unit='D')
+        + pd.to_timedelta(RNG.uniform(0, 600, count), unit='m')
+    )
+    close_times = open_times + pd.to_timedelta(RNG.uniform(5, 300, count), unit='m')
+
+    open_prices = snap_to_tick(BASE_PRICE + days_offsets * DRIFT_PER_DAY + RNG.normal(0, VOLATILITY, count))
+
+    wins = RNG.random(count) < WIN_RATE
+    points = np.where(wins, RNG.uniform(15, 90, count), -RNG.uniform(10, 45, count))
+    direction = np.where(trade_types == 'buy', 1.0, -1.0)
+    close_prices = snap_to_tick(open_prices + direction * points)
+
+    profits = np.round(points * POINT_VALUE * volumes, 2)
+    commissions = np.round(COMMISSION_PER_CONTRACT * volumes.astype(np.float64), 2)
+    net_profits = np.round(profits - commissions, 2)
+
+    open_py = open_times.to_pydatetime()
+    close_py = close_times.to_pydatetime()
+
+    rows = []
+    for i in range(count):
+        rows.append({
+            'user_id': user_id,
+            'trade_source': TradeSource.MANUAL,
+            'symbol': 'NQ',
+            'trade_type': TradeType.BUY if trade_types[i] == 'buy' else TradeType.SELL,
+            'volume': float(volumes[i]),
+            'open_price': float(open_prices[i]),
+            'close_price': float(close_prices[i]),
+            'open_time': open_py[i],
+            'close_time': close_py[i],
+            'profit': float(profits[i]),
+            'commission': float(commissions[i]),
+            'swap': 0.0,
+            'net_profit': float(net_profits[i]),
+            'is_closed': True
+        })
+    return rows
+
+
+def print_stats(db, user_id: int):
+    """Print summary statistics for the generated trades.
+
+    Computed with aggregate SELECTs - no Trade objects are hydrated just to
+    sum three scalars.
+    """
+    total, wins, net = db.execute(
+        select(
+            func.count(),
+            func.sum(case((Trade.net_profit > 0, 1), else_=0)),
+            func.sum(Trade.net_profit)
+        ).where(Trade.user_id == user_id, Trade.symbol == 'NQ', Trade.is_closed == True)
+    ).one()
+
+    # One grouped SELECT gives gross profit and gross loss for profit factor
+    split = dict(db.execute(
+        select(Trade.net_profit > 0, func.sum(Trade.net_profit))
+        .where(Trade.user_id == user_id, Trade.symbol == 'NQ', Trade.is_closed == True)
+        .group_by(Trade.net_profit > 0)
+    ).all())
+
+    gross_profit = split.get(True, 0) or 0
+    gross_loss = abs(split.get(False, 0) or 0)
+
+    print("\n" + "=" * 60)
+    print("✓ NQ trades generated successfully!")
+    print("=" * 60)
+    print(f"Total NQ trades: {total}")
+    print(f"Winners:         {wins} ({wins / total * 100:.1f}%)" if total else "Winners:         0")
+    print(f"Net P&L:         ${net:,.2f}")
+    if gross_loss > 0:
+        print(f"Profit factor:   {gross_profit / gross_loss:.2f}")
+    print("=" * 60)
+
+
+def generate_nq_trades():
+    """Generate NQ sample trades for the demo user."""
+    db = SessionLocal()
+
+    try:
+        user = db.query(User).filter(User.email == DEMO_EMAIL).first()
+        if not user:
+            print(f"✗ User {DEMO_EMAIL} not found. Run create_admin.py first.")
+            return
+
+        start_date = datetime.now(timezone.utc) - timedelta(days=120)
+
+        rows = build_trade_rows(user.id, start_date, NUM_TRADES)
+
+        db.execute(Trade.__table__.insert(), rows)
+        db.commit()
+        print(f"Inserted {len(rows)} NQ trades")
+
+        print_stats(db, user.id)
+
+    except Exception as e:
+        print(f"✗ Error generating NQ trades: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    print("Generating NQ sample trades...\n")
+    generate_nq_trades()
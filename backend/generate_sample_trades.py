@@ -0,0 +1,198 @@
+"""
+Script to generate sample trades with journal entries for the demo account.
+Defaults to 100 trades; pass a count for larger seeds:
+    python generate_sample_trades.py 5000
+"""
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, select
+
+from app.config import settings
+from app.models.trade import Trade, TradeType, TradeSource
+from app.models.journal import JournalEntry
+from app.models.user import User
+
+DEMO_EMAIL = "admin@trading-journal.com"
+
+# Seeder-specific engine with psycopg2 batch mode enabled so executemany
+# collapses into a few round-trips instead of degrading to per-row INSERTs
+engine = create_engine(
+    settings.DATABASE_URL,
+    executemany_mode='values_plus_batch',
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500
+)
+
+# Commit every BATCH_SIZE trades so large seeds don't hold one giant write
+# transaction (unbounded WAL + memory); 1k-5k is the sweet spot for batches
+BATCH_SIZE = 1000
+
+WIN_RATE = 0.58
+COMMISSION_PER_CONTRACT = 2.25
+
+# Per-symbol market profile used to keep generated prices realistic
+SYMBOLS = {
+    'ES': {
+        'base_price': 4850.0, 'volatility': 12.0, 'drift_per_day': 1.5,
+        'point_value': 50.0, 'win_points': (4, 30), 'loss_points': (3, 15)
+    },
+    'NQ': {
+        'base_price': 17250.0, 'volatility': 45.0, 'drift_per_day': 6.0,
+        'point_value': 20.0, 'win_points': (15, 90), 'loss_points': (10, 45)
+    },
+    'YM': {
+        'base_price': 38500.0, 'volatility': 90.0, 'drift_per_day': 10.0,
+        'point_value': 5.0, 'win_points': (30, 200), 'loss_points': (20, 100)
+    },
+    'GC': {
+        'base_price': 2045.0, 'volatility': 6.0, 'drift_per_day': 0.8,
+        'point_value': 100.0, 'win_points': (2, 12), 'loss_points': (1, 6)
+    },
+    'CL': {
+        'base_price': 78.0, 'volatility': 0.9, 'drift_per_day': 0.1,
+        'point_value': 1000.0, 'win_points': (0.2, 1.5), 'loss_points': (0.1, 0.8)
+    },
+}
+
+WIN_JOURNAL_TEMPLATES = [
+    "Clean breakout on {symbol}, took profit at +{points} points as planned.",
+    "Waited for the retest on {symbol} and it paid off - banked {points} points.",
+    "Strong momentum entry on {symbol}, trailed the stop and closed +{points}.",
+    "{symbol} respected the level perfectly. Out at +{points} points.",
+    "Patience rewarded on {symbol}: let the setup come to me, +{points} points.",
+    "Good risk management on {symbol}, scaled out into strength for {points} points.",
+    "Trend continuation on {symbol} worked exactly as mapped out, +{points}.",
+    "News spike on {symbol} hit the target fast. +{points} points in minutes.",
+    "Textbook pullback entry on {symbol}. Closed at +{points} points.",
+    "Held {symbol} through the chop and the thesis played out, +{points} points.",
+]
+
+LOSS_JOURNAL_TEMPLATES = [
+    "Stopped out on {symbol} for -{points} points. Entry was too early.",
+    "Chased the move on {symbol} and paid for it: -{points} points.",
+    "{symbol} reversed right after entry, cut it quickly at -{points}.",
+    "Faded the trend on {symbol} against my own rules. -{points} points.",
+    "Choppy session on {symbol}, should have stayed flat. -{points} points.",
+    "Moved my stop on {symbol} and turned a small loss into -{points} points.",
+    "Late entry on {symbol}, risk/reward was gone. Closed -{points}.",
+    "News whipsaw on {symbol} took out the stop for -{points} points.",
+    "Overtraded {symbol} after two winners. Gave back {points} points.",
+    "Setup on {symbol} was valid but failed - accepted the -{points} point loss.",
+]
+
+# Split each template once at import - str.format re-parses the template on
+# every call, while the split form leaves two replace() calls and a concat
+WIN_TEMPLATE_PARTS = [t.split('{points}') for t in WIN_JOURNAL_TEMPLATES]
+LOSS_TEMPLATE_PARTS = [t.split('{points}') for t in LOSS_JOURNAL_TEMPLATES]
+
+EMOTIONS = ["confident", "neutral", "anxious", "frustrated", "disciplined"]
+
+
+def render_journal_note(parts: list, symbol: str, points: float) -> str:
+    """Render a pre-split journal template for one trade."""
+    head, tail = parts
+    return head.replace('{symbol}', symbol) + str(points) + tail.replace('{symbol}', symbol)
+
+
+def generate_sample_trades(num_trades: int = 100):
+    """Generate sample trades and matching journal entries for the demo user.
+
+    Rows are built as plain dicts and inserted through Core executemany -
+    write-only synthetic data gains nothing from ORM identity-map tracking.
+    """
+    with engine.connect() as conn:
+        user_id = conn.execute(
+            select(User.id).where(User.email == DEMO_EMAIL)
+        ).scalar_one_or_none()
+        if user_id is None:
+            print(f"✗ User {DEMO_EMAIL} not found. Run create_admin.py first.")
+            return
+
+        start_date = datetime.now(timezone.utc) - timedelta(days=120)
+
+        trade_rows = []
+        journal_rows = []  # trade_id is filled in per chunk after the trade insert
+
+        for _ in range(num_trades):
+            symbol = random.choice(list(SYMBOLS.keys()))
+            config = SYMBOLS[symbol]
+
+            days_offset = random.uniform(0, 120)
+            open_time = start_date + timedelta(days=days_offset) + timedelta(minutes=random.uniform(0, 600))
+            close_time = open_time + timedelta(minutes=random.uniform(5, 300))
+
+            trade_type = random.choice(['buy', 'sell'])
+            volume = random.choices([1, 2, 3], weights=[0.7, 0.25, 0.05])[0]
+
+            open_price = round(
+                config['base_price'] + days_offset * config['drift_per_day'] + random.gauss(0, config['volatility']), 2
+            )
+
+            if random.random() < WIN_RATE:
+                points = random.uniform(*config['win_points'])
+            else:
+                points = -random.uniform(*config['loss_points'])
+
+            if trade_type == 'buy':
+                close_price = round(open_price + points, 2)
+            else:
+                close_price = round(open_price - points, 2)
+
+            profit = round(points * config['point_value'] * volume, 2)
+            commission = round(COMMISSION_PER_CONTRACT * volume, 2)
+
+            trade_rows.append({
+                'user_id': user_id,
+                'trade_source': TradeSource.MANUAL,
+                'symbol': symbol,
+                'trade_type': TradeType.BUY if trade_type == 'buy' else TradeType.SELL,
+                'volume': float(volume),
+                'open_price': open_price,
+                'close_price': close_price,
+                'open_time': open_time,
+                'close_time': close_time,
+                'profit': profit,
+                'commission': commission,
+                'swap': 0.0,
+                'net_profit': round(profit - commission, 2),
+                'is_closed': True
+            })
+
+            template_parts = random.choice(WIN_TEMPLATE_PARTS if points > 0 else LOSS_TEMPLATE_PARTS)
+            journal_rows.append({
+                'user_id': user_id,
+                'title': f"{symbol} {trade_type} - {open_time.strftime('%b %d')}",
+                'notes': render_journal_note(template_parts, symbol, round(abs(points), 2)),
+                'emotional_state': random.choice(EMOTIONS)
+            })
+
+        created = 0
+        for i in range(0, num_trades, BATCH_SIZE):
+            trade_chunk = trade_rows[i:i + BATCH_SIZE]
+            journal_chunk = journal_rows[i:i + BATCH_SIZE]
+
+            trade_ids = conn.execute(
+                Trade.__table__.insert().returning(Trade.id, sort_by_parameter_order=True),
+                trade_chunk
+            ).scalars().all()
+
+            for row, trade_id in zip(journal_chunk, trade_ids):
+                row['trade_id'] = trade_id
+            conn.execute(JournalEntry.__table__.insert(), journal_chunk)
+
+            conn.commit()
+            created += len(trade_chunk)
+            if num_trades > BATCH_SIZE:
+                print(f"  ...committed {created}/{num_trades} trades")
+
+        print("\n" + "=" * 60)
+        print(f"✓ Generated {created} sample trades with journal entries!")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print(f"Generating {count} sample trades...\n")
+    generate_sample_trades(count)
@@ -0,0 +1,403 @@
+"""
+Script to generate sample trades with journal entries through the public API.
+Exercises the real auth + validation path, unlike the direct-DB seeders.
+Run this from the backend directory with the server up:
+    python generate_via_api.py
+or bypass the API and write straight to the database:
+    python generate_via_api.py --direct
+"""
+import asyncio
+import gzip
+import json
+import os
+import string
+import sys
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import numpy as np
+
+# Numba is optional: with it installed the P&L kernel is JIT-compiled to
+# machine code, which pays off when seeding tens of thousands of trades
+try:
+    from numba import njit, prange
+    USE_NUMBA = True
+except ImportError:
+    USE_NUMBA = False
+
+# orjson is optional too; it encodes dict-heavy payloads with floats a few
+# times faster than the stdlib encoder
+try:
+    import orjson
+
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+BASE_URL = os.environ.get("API_URL", "http://localhost:8000") + "/api"
+
+DEMO_EMAIL = "admin@trading-journal.com"
+DEMO_PASSWORD = "Admin123!"
+
+NUM_TRADES = 100
+WIN_RATE = 0.58
+
+# Generator API (PCG64) is faster than the legacy np.random.* functions
+# and keeps all draws on one explicit stream
+RNG = np.random.default_rng()
+
+# How many batch requests may be in flight at once
+CONCURRENCY = 4
+
+# Trade+journal items per /trades/batch request
+BATCH_SIZE = 25
+
+# Futures contract specs used to keep generated prices realistic
+FUTURES = {
+    'ES': {'tick': 0.25, 'multiplier': 50.0, 'price_range': (4700, 5000)},
+    'NQ': {'tick': 0.25, 'multiplier': 20.0, 'price_range': (16800, 17800)},
+    'YM': {'tick': 1.0, 'multiplier': 5.0, 'price_range': (37800, 39200)},
+    'GC': {'tick': 0.1, 'multiplier': 100.0, 'price_range': (2000, 2100)},
+    'CL': {'tick': 0.01, 'multiplier': 1000.0, 'price_range': (74, 82)},
+}
+
+# Materialized once; rebuilding list(FUTURES.keys()) per draw is wasted work
+SYMBOL_KEYS = tuple(FUTURES)
+
+# Contract-spec lookup arrays, built once at import so repeated generation
+# passes only pay for the fancy-indexing, not for rebuilding the tables
+TICK = np.array([FUTURES[k]['tick'] for k in SYMBOL_KEYS])
+MULT = np.array([FUTURES[k]['multiplier'] for k in SYMBOL_KEYS])
+PRICE_LOW = np.array([FUTURES[k]['price_range'][0] for k in SYMBOL_KEYS], dtype=np.float64)
+PRICE_HIGH = np.array([FUTURES[k]['price_range'][1] for k in SYMBOL_KEYS], dtype=np.float64)
+
+CONTRACT_SIZES = np.arange(1, 9)
+CONTRACT_WEIGHTS = np.array([30, 25, 15, 10, 8, 6, 4, 2], dtype=np.float64)
+CONTRACT_PROBS = CONTRACT_WEIGHTS / CONTRACT_WEIGHTS.sum()
+
+SETUPS = [
+    "opening range breakout", "VWAP pullback", "trend continuation",
+    "failed breakdown reversal", "range fade", "news momentum",
+]
+
+WIN_JOURNAL_TEMPLATES = [
+    "Took the {setup} on {symbol} exactly per plan. Banked {profit} and moved on.",
+    "{symbol} {setup} triggered cleanly - scaled out into strength for {profit}.",
+    "Patience paid on {symbol}: waited for the {setup} confirmation, +{profit}.",
+    "Solid execution on the {symbol} {setup}. Risk was defined, result {profit}.",
+    "The {setup} on {symbol} hit target fast. {profit} with no heat on the trade.",
+]
+
+LOSS_JOURNAL_TEMPLATES = [
+    "The {setup} on {symbol} failed - stopped out for {loss}. Entry was rushed.",
+    "Forced the {setup} on {symbol} in chop and paid {loss} for it.",
+    "{symbol} reversed right after the {setup} entry. Cut it at {loss}.",
+    "Took the {setup} on {symbol} against the higher timeframe. {loss} lesson.",
+    "Stop was too tight on the {symbol} {setup}; shaken out for {loss}.",
+]
+
+EMOTIONS = ["confident", "neutral", "anxious", "frustrated", "disciplined"]
+
+
+def _compile_template(template: str):
+    """Parse a template once into literal/field ops; rendering is a join."""
+    ops = []
+    for literal, field, _, _ in string.Formatter().parse(template):
+        if literal:
+            ops.append((False, literal))
+        if field is not None:
+            ops.append((True, field))
+
+    def render(values: dict, _ops=tuple(ops)) -> str:
+        return "".join(values[payload] if is_field else payload for is_field, payload in _ops)
+
+    return render
+
+
+# Compile each template once at import; picking a note is then an index into
+# a tuple of renderers instead of re-parsing the format string per trade
+WIN_CALLS = tuple(_compile_template(t) for t in WIN_JOURNAL_TEMPLATES)
+LOSS_CALLS = tuple(_compile_template(t) for t in LOSS_JOURNAL_TEMPLATES)
+
+
+if USE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _pnl_kernel(entries, exits, mults, contracts, outcomes, out_nets):
+        """Write net P&L per trade straight into out_nets, no temporaries."""
+        for i in prange(entries.shape[0]):
+            gross = abs(exits[i] - entries[i]) * mults[i] * contracts[i]
+            fee = 4.0 * contracts[i]
+            net = gross - fee if outcomes[i] else -(gross + fee)
+            out_nets[i] = round(net, 2)
+
+
+def compute_net_pnl(entries, exits, mults, contracts, outcomes):
+    """Net P&L for all trades; JIT kernel when numba is available."""
+    if USE_NUMBA:
+        nets = np.empty(entries.shape[0], dtype=np.float64)
+        _pnl_kernel(entries, exits, mults, contracts.astype(np.float64), outcomes, nets)
+        return nets
+    gross = np.abs(exits - entries) * mults * contracts
+    return np.round(np.where(outcomes, gross - 4 * contracts, -(gross + 4 * contracts)), 2)
+
+
+async def login(client: httpx.AsyncClient) -> str:
+    """Log in as the demo user and return the access token."""
+    response = await client.post("/auth/login", json={
+        "email": DEMO_EMAIL,
+        "password": DEMO_PASSWORD
+    })
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def generate_trades_bulk(n: int, start_date: datetime) -> list:
+    """Generate n trade payloads in one vectorized pass.
+
+    Entry prices, tick-snapped exits, contracts and P&L are all computed as
+    whole arrays; only the final serialization loop touches Python objects.
+    Returns a list of (trade_data, is_winner) pairs.
+    """
+    sym_idx = RNG.integers(0, len(SYMBOL_KEYS), n)
+    ticks = TICK[sym_idx]
+    mults = MULT[sym_idx]
+
+    entries = np.round(np.round(RNG.uniform(PRICE_LOW[sym_idx], PRICE_HIGH[sym_idx]) / ticks) * ticks, 2)
+    outcomes = RNG.random(n) < WIN_RATE
+    ticks_moved = np.where(outcomes, RNG.integers(5, 41, n), RNG.integers(3, 16, n))
+    signs = np.where(RNG.random(n) > 0.5, 1.0, -1.0)
+    exits = np.round(entries + signs * ticks_moved * ticks, 2)
+
+    contracts = RNG.choice(CONTRACT_SIZES, n, p=CONTRACT_PROBS)
+
+    nets = compute_net_pnl(entries, exits, mults, contracts, outcomes)
+    commissions = np.round(2.0 * contracts.astype(np.float64), 2)
+
+    # buy when a winner closed higher / a loser closed lower
+    buys = np.where(outcomes, exits > entries, exits < entries)
+
+    day_offsets = RNG.uniform(0, 90, n)
+    hour_offsets = RNG.uniform(0, 23, n)
+    minute_offsets = RNG.uniform(0, 59, n)
+    durations = RNG.uniform(5, 180, n)
+
+    # One total offset in seconds per trade - datetime64 arithmetic replaces
+    # the per-trade timedelta allocations, and the ISO strings come out of a
+    # single vectorized pass
+    base = np.datetime64(start_date.replace(tzinfo=None), 's')
+    open_times = base + (day_offsets * 86400 + hour_offsets * 3600 + minute_offsets * 60).astype('timedelta64[s]')
+    close_times = open_times + (durations * 60).astype('timedelta64[s]')
+    open_iso = np.datetime_as_string(open_times, unit='s', timezone='UTC')
+    close_iso = np.datetime_as_string(close_times, unit='s', timezone='UTC')
+
+    trades = []
+    for i in range(n):
+        trades.append(({
+            "symbol": SYMBOL_KEYS[sym_idx[i]],
+            "trade_type": 'buy' if buys[i] else 'sell',
+            "volume": float(contracts[i]),
+            "open_price": float(entries[i]),
+            "close_price": float(exits[i]),
+            "open_time": str(open_iso[i]),
+            "close_time": str(close_iso[i]),
+            "profit": float(nets[i]),
+            "commission": float(commissions[i]),
+            "is_closed": True
+        }, bool(outcomes[i])))
+    return trades
+
+
+def generate_journals_bulk(trades: list) -> list:
+    """Generate journal payloads for (trade_data, is_winner) pairs.
+
+    The template/setup/emotion picks are drawn as whole index vectors up
+    front instead of three random.choice calls per trade.
+    """
+    n = len(trades)
+    template_idx = RNG.integers(0, len(WIN_CALLS), n)
+    setup_idx = RNG.integers(0, len(SETUPS), n)
+    emotion_idx = RNG.integers(0, len(EMOTIONS), n)
+
+    journals = []
+    for i, (trade_data, is_winner) in enumerate(trades):
+        amount = f"${abs(trade_data['profit']):,.2f}"
+        calls = WIN_CALLS if is_winner else LOSS_CALLS
+        notes = calls[template_idx[i]]({
+            'symbol': trade_data['symbol'],
+            'setup': SETUPS[setup_idx[i]],
+            'profit': amount,
+            'loss': amount
+        })
+        journals.append({
+            "title": f"{trade_data['symbol']} {trade_data['trade_type']}",
+            "notes": notes,
+            "emotional_state": EMOTIONS[emotion_idx[i]]
+        })
+    return journals
+
+
+async def post_batch(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    index: int,
+    items: list
+) -> tuple:
+    """POST one chunk of trade+journal items.
+
+    Returns (created_count, error_message_or_None); nothing is printed here
+    so concurrent completions don't serialize on stdout.
+    """
+    # The batch payload is highly repetitive JSON; gzip cuts the bytes on
+    # the wire by 5-10x and the server inflates it before validation
+    body = gzip.compress(json_dumps({"items": items}))
+
+    async with sem:
+        response = await client.post(
+            "/trades/batch",
+            content=body,
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"}
+        )
+        if response.status_code != 201:
+            return 0, f"batch {index + 1}: {response.status_code} - {response.text}"
+        return response.json()["created"], None
+
+
+async def main():
+    """Generate NUM_TRADES trades with journals through the API concurrently."""
+    transport = httpx.AsyncHTTPTransport(retries=3)
+    limits = httpx.Limits(max_connections=CONCURRENCY, max_keepalive_connections=CONCURRENCY)
+
+    async with httpx.AsyncClient(base_url=BASE_URL, transport=transport, limits=limits, timeout=30) as client:
+        print(f"Logging in to {BASE_URL}...")
+        token = await login(client)
+        # Set the auth header once; every subsequent call reuses it
+        client.headers["Authorization"] = f"Bearer {token}"
+        print("✓ Logged in\n")
+
+        start_date = datetime.now(timezone.utc) - timedelta(days=90)
+
+        # Pre-generate everything, then ship it in a handful of batch
+        # requests instead of two round-trips per trade
+        trades = generate_trades_bulk(NUM_TRADES, start_date)
+        journals = generate_journals_bulk(trades)
+        items = [
+            {"trade": trade_data, "journal": journal_data}
+            for (trade_data, _), journal_data in zip(trades, journals)
+        ]
+
+        chunks = [items[i:i + BATCH_SIZE] for i in range(0, len(items), BATCH_SIZE)]
+
+        sem = asyncio.Semaphore(CONCURRENCY)
+        results = await asyncio.gather(
+            *[post_batch(client, sem, i, chunk) for i, chunk in enumerate(chunks)],
+            return_exceptions=True
+        )
+
+    # Report once at the end instead of per completion
+    created = 0
+    failures = []
+    for result in results:
+        if isinstance(result, BaseException):
+            failures.append(str(result))
+        else:
+            count, error = result
+            created += count
+            if error:
+                failures.append(error)
+
+    print("\n" + "=" * 60)
+    print(f"✓ Created {created}/{NUM_TRADES} trades via the API")
+    for failure in failures:
+        print(f"✗ {failure}")
+    print("=" * 60)
+
+
+def seed_direct():
+    """Seed trades straight into the DB with bulk_insert_mappings.
+
+    Skips the HTTP round-trips, token auth and Pydantic validation of the
+    API path - useful when only the data matters, not the request path.
+    """
+    from sqlalchemy import select
+
+    from app.database import SessionLocal
+    from app.models.trade import Trade, TradeType, TradeSource
+    from app.models.journal import JournalEntry
+    from app.models.user import User
+
+    db = SessionLocal()
+
+    try:
+        user_id = db.execute(
+            select(User.id).where(User.email == DEMO_EMAIL)
+        ).scalar_one_or_none()
+        if user_id is None:
+            print(f"✗ User {DEMO_EMAIL} not found. Run create_admin.py first.")
+            return
+
+        start_date = datetime.now(timezone.utc) - timedelta(days=90)
+
+        trades = generate_trades_bulk(NUM_TRADES, start_date)
+        journals = generate_journals_bulk(trades)
+
+        trade_rows = []
+        journal_rows = []
+        for (trade_data, _), journal_data in zip(trades, journals):
+            trade_rows.append({
+                'user_id': user_id,
+                'trade_source': TradeSource.MANUAL,
+                'symbol': trade_data['symbol'],
+                'trade_type': TradeType.BUY if trade_data['trade_type'] == 'buy' else TradeType.SELL,
+                'volume': trade_data['volume'],
+                'open_price': trade_data['open_price'],
+                'close_price': trade_data['close_price'],
+                'open_time': datetime.fromisoformat(trade_data['open_time']),
+                'close_time': datetime.fromisoformat(trade_data['close_time']),
+                'profit': trade_data['profit'],
+                'commission': trade_data['commission'],
+                'swap': 0.0,
+                'net_profit': round(trade_data['profit'] - trade_data['commission'], 2),
+                'is_closed': True
+            })
+            journal_rows.append({
+                'user_id': user_id,
+                'title': journal_data['title'],
+                'notes': journal_data['notes'],
+                'emotional_state': journal_data['emotional_state']
+            })
+
+        db.bulk_insert_mappings(Trade, trade_rows)
+        db.flush()
+
+        # bulk_insert_mappings doesn't return IDs; the last N for this user
+        # are ours since we're still inside the same transaction
+        trade_ids = db.execute(
+            select(Trade.id).where(Trade.user_id == user_id)
+            .order_by(Trade.id.desc()).limit(len(trade_rows))
+        ).scalars().all()[::-1]
+
+        for row, trade_id in zip(journal_rows, trade_ids):
+            row['trade_id'] = trade_id
+        db.bulk_insert_mappings(JournalEntry, journal_rows)
+
+        db.commit()
+
+        print("=" * 60)
+        print(f"✓ Seeded {len(trade_rows)} trades with journals directly into the DB")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"✗ Error seeding trades: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    if "--direct" in sys.argv:
+        seed_direct()
+    else:
+        asyncio.run(main())
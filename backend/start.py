@@ -14,5 +14,12 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # "auto" picks uvloop/httptools when importable; uvloop is never
+        # installed on Windows (uvicorn[standard] excludes it there), and
+        # this script is how start.bat/start.ps1 launch the backend
+        loop="auto",
+        http="auto",
+        # reload mode only supports a single worker
+        workers=1 if settings.DEBUG else int(os.environ.get("WEB_CONCURRENCY", "2"))
     )
@@ -3,7 +3,6 @@ Startup script that runs database migrations before starting the server.
 """
 import os
 import sys
-import subprocess
 
 def fix_verification_columns():
     """Add verification columns if they don't exist."""
@@ -11,16 +10,13 @@ def fix_verification_columns():
     print("Checking verification columns...")
     print("=" * 60)
     try:
-        result = subprocess.run(
-            ["python", "fix_verification_columns.py"],
-            check=True,
-            capture_output=False,
-            text=True
-        )
+        # Run in-process instead of spawning a fresh interpreter
+        from fix_verification_columns import add_verification_columns
+        add_verification_columns()
         print("=" * 60)
         print("✓ Verification columns check completed!")
         print("=" * 60)
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print("=" * 60)
         print(f"✗ Verification fix failed: {e}")
         print("Continuing with migrations anyway...")
@@ -32,28 +28,51 @@ def run_migrations():
     print("Running database migrations...")
     print("=" * 60)
     try:
-        result = subprocess.run(
-            ["alembic", "upgrade", "head"],
-            check=True,
-            capture_output=False,
-            text=True
-        )
+        # In-process upgrade avoids the alembic CLI fork+exec on every boot
+        from alembic import command
+        from alembic.config import Config
+        from alembic.runtime.migration import MigrationContext
+        from alembic.script import ScriptDirectory
+
+        cfg = Config("alembic.ini")
+        script = ScriptDirectory.from_config(cfg)
+
+        # Short-circuit on warm containers: comparing the stored revision
+        # against the script head is one SELECT, versus the full Alembic
+        # env.py bootstrap that command.upgrade pays even when up to date
+        from app.database import engine
+        with engine.connect() as connection:
+            current = MigrationContext.configure(connection).get_current_revision()
+
+        if current is not None and current == script.get_current_head():
+            print("✓ Database already at head - skipping migrations")
+            print("=" * 60)
+            return
+
+        command.upgrade(cfg, "head")
         print("=" * 60)
         print("✓ Migrations completed successfully!")
         print("=" * 60)
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print("=" * 60)
         print(f"✗ Migration failed: {e}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
         print("Continuing with application startup...")
         print("=" * 60)
 
 def start_server():
     """Start the uvicorn server."""
     port = os.environ.get("PORT", "8000")
-    print(f"Starting FastAPI server on port {port}...")
-    os.execvp("uvicorn", ["uvicorn", "app.main:app", "--host", "0.0.0.0", "--port", str(port)])
+    workers = os.environ.get("WEB_CONCURRENCY", "2")
+    print(f"Starting FastAPI server on port {port} with {workers} workers...")
+    os.execvp("uvicorn", [
+        "uvicorn", "app.main:app",
+        "--host", "0.0.0.0",
+        "--port", str(port),
+        # uvloop/httptools ship with uvicorn[standard]; make them explicit
+        "--loop", "uvloop",
+        "--http", "httptools",
+        "--workers", workers
+    ])
 
 if __name__ == "__main__":
     fix_verification_columns()
@@ -0,0 +1,47 @@
+"""
+Script to smoke-test the API: login, fetch the current user, then fetch
+chat messages. Run this from the backend directory with the server up:
+    python test_api.py
+"""
+import os
+
+import httpx
+
+API_URL = os.environ.get("API_URL", "http://localhost:8000")
+
+DEMO_EMAIL = "admin@trading-journal.com"
+DEMO_PASSWORD = "Admin123!"
+
+
+def test_api():
+    """Run the login -> /me -> chat messages round-trip."""
+    # One client = one TLS session for all three calls; http2 lets them
+    # multiplex over a single connection when the server supports it
+    with httpx.Client(http2=True, base_url=API_URL, timeout=30) as client:
+        print(f"Logging in to {API_URL}...")
+        response = client.post("/api/auth/login", json={
+            "email": DEMO_EMAIL,
+            "password": DEMO_PASSWORD
+        })
+        if response.status_code != 200:
+            print(f"✗ Login failed: {response.status_code} - {response.text}")
+            return
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+        print("✓ Logged in")
+
+        response = client.get("/api/auth/me")
+        if response.status_code != 200:
+            print(f"✗ /auth/me failed: {response.status_code} - {response.text}")
+            return
+        me = response.json()
+        print(f"✓ Current user: {me['email']}")
+
+        response = client.get("/api/chat/messages")
+        if response.status_code != 200:
+            print(f"✗ /chat/messages failed: {response.status_code} - {response.text}")
+            return
+        print(f"✓ Fetched {len(response.json())} chat messages")
+
+
+if __name__ == "__main__":
+    test_api()
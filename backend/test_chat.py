@@ -0,0 +1,71 @@
+"""
+Script to seed chat messages between the admin and a user for testing the
+support chat. Pass a count to seed a larger conversation:
+    python test_chat.py 500
+"""
+import sys
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from app.database import SessionLocal
+from app.models.user import User, UserRole
+
+SAMPLE_MESSAGES = [
+    "Hi, my MT5 sync seems stuck on 'pending' - can you take a look?",
+    "Sure, checking your account now.",
+    "The broker server was briefly unreachable; I re-queued the sync.",
+    "Thanks! The trades are showing up now.",
+    "Great. Let us know if anything else comes up.",
+    "One more thing - can I change my sync interval?",
+    "Yes, it's under MT5 settings, anywhere from 1 to 60 minutes.",
+    "Perfect, set it to 5 minutes.",
+]
+
+
+def seed_chat_messages(count: int = 20):
+    """Seed a test conversation between the admin and the first user."""
+    db = SessionLocal()
+
+    try:
+        admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
+        if not admin:
+            print("✗ No admin user found. Run create_admin.py first.")
+            return
+
+        user = db.query(User).filter(User.role != UserRole.ADMIN).first() or admin
+
+        now = datetime.now(timezone.utc)
+        rows = []
+        for i in range(count):
+            from_admin = i % 2 == 1
+            rows.append({
+                'user_id': admin.id if from_admin else user.id,
+                'conversation_user_id': user.id,
+                'message': SAMPLE_MESSAGES[i % len(SAMPLE_MESSAGES)],
+                'is_admin': from_admin,
+                'created_at': now - timedelta(minutes=count - i)
+            })
+
+        # One executemany moves the whole batch in a single round-trip
+        # instead of issuing an INSERT per message
+        db.execute(text("""
+            INSERT INTO chat_messages (user_id, conversation_user_id, message, is_admin, created_at)
+            VALUES (:user_id, :conversation_user_id, :message, :is_admin, :created_at)
+        """), rows)
+        db.commit()
+
+        print(f"✓ Seeded {count} chat messages for conversation with user {user.id}")
+
+    except Exception as e:
+        print(f"✗ Error seeding chat messages: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    message_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"Seeding {message_count} chat messages...\n")
+    seed_chat_messages(message_count)
@@ -0,0 +1,62 @@
+"""
+Script to verify a chat message can be inserted and read back.
+Run this from the backend directory:
+    python test_chat_insert.py
+"""
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+# Reuse the app's pooled engine (pool_pre_ping, shared QueuePool) instead of
+# building a throwaway engine per script run
+from app.database import SessionLocal
+from app.models.user import User, UserRole
+
+
+def test_chat_insert():
+    """Insert one chat message and read it back."""
+    db = SessionLocal()
+
+    try:
+        admin = db.query(User).filter(User.role == UserRole.ADMIN).first()
+        if not admin:
+            print("✗ No admin user found. Run create_admin.py first.")
+            return
+
+        result = db.execute(text("""
+            INSERT INTO chat_messages (user_id, conversation_user_id, message, is_admin, created_at)
+            VALUES (:user_id, :conversation_user_id, :message, :is_admin, :created_at)
+            RETURNING id
+        """), {
+            'user_id': admin.id,
+            'conversation_user_id': admin.id,
+            'message': 'test_chat_insert.py check message',
+            'is_admin': True,
+            'created_at': datetime.now(timezone.utc)
+        })
+        message_id = result.scalar_one()
+        db.commit()
+
+        row = db.execute(text("""
+            SELECT message FROM chat_messages WHERE id = :id
+        """), {'id': message_id}).fetchone()
+
+        if row and row[0] == 'test_chat_insert.py check message':
+            print(f"✓ Inserted and read back chat message {message_id}")
+        else:
+            print(f"✗ Message {message_id} did not round-trip correctly")
+
+        # Clean up the check message
+        db.execute(text("DELETE FROM chat_messages WHERE id = :id"), {'id': message_id})
+        db.commit()
+
+    except Exception as e:
+        print(f"✗ Error testing chat insert: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    test_chat_insert()
@@ -1,26 +1,40 @@
 """
-MT5 Serial Sync Service for VPS
-================================
-This script runs on your Windows VPS and syncs trades for all users one by one.
+MT5 Sync Service for VPS
+========================
+This script runs on your Windows VPS and syncs trades for all users.
 
 Setup:
 1. Install Python 3.8+ on your VPS
 2. Install MT5 terminal on VPS
-3. pip install MetaTrader5 psycopg2-binary sqlalchemy cryptography requests
+3. pip install -r requirements.txt
 4. Set your DATABASE_URL and ENCRYPTION_KEY environment variables
 5. Run: python mt5_sync_service.py
 
 The script will:
 - Loop through all active MT5 accounts
-- Login to each account, sync trades, then logout
-- Process one account at a time (serial processing)
+- Login to each account and sync its trades
+- Overlap the API/DB work across accounts with a thread pool; terminal
+  access itself is serialized because MetaTrader5 is process-global
 - Repeat every minute
+
+The concurrency model is threads rather than asyncio on purpose: the
+official MetaTrader5 API is blocking and can only attach one terminal per
+process, so an async port would still serialize on the terminal while
+adding an event loop around everything else. The pool gives the same
+overlap of network waits with the driver stack we already ship.
 """
 
+import atexit
+import csv
+import io
 import os
+import shelve
 import sys
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Tuple
 import traceback
@@ -33,9 +47,19 @@ except ImportError:
     print("Run: pip install MetaTrader5")
     sys.exit(1)
 
+import pandas as pd
+
+# orjson is optional; it parses the account list 2-3x faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 import base64
+import hashlib
+import hmac
 
 # ============================================
 # CONFIGURATION - SET THESE ON YOUR VPS
@@ -47,6 +71,59 @@ API_URL = os.environ.get('API_URL', 'https://dependable-solace-production-75f7.u
 # How often to check for accounts to sync (in seconds)
 SYNC_CHECK_INTERVAL = 60
 
+# Floor for the adaptive sleep between cycles (in seconds)
+MIN_SYNC_SLEEP = int(os.environ.get('MIN_SYNC_SLEEP', '5'))
+
+# Server-side symbol filter for history_deals_get - narrow it (e.g. '*USD*')
+# to shrink the payload ferried over from the terminal
+DEALS_GROUP = os.environ.get('MT5_DEALS_GROUP', '*')
+
+# How many accounts may be in their API/DB phase at once. The MT5 terminal
+# itself is process-global, so terminal access stays serialized via MT5_LOCK;
+# the pool overlaps the network and database work across accounts.
+SYNC_WORKERS = int(os.environ.get('SYNC_WORKERS', '4'))
+
+MT5_LOCK = threading.Lock()
+
+# Hard bound on a single MT5 RPC (seconds) - a hung broker link fails the
+# account's sync instead of stalling the whole cycle
+MT5_CALL_TIMEOUT = int(os.environ.get('MT5_CALL_TIMEOUT', '60'))
+
+# Dedicated single worker for bounding MT5 RPCs
+_MT5_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_MT5_EXECUTOR_LOCK = threading.Lock()
+
+
+def mt5_call(func, *args, **kwargs):
+    """Run an MT5 RPC with a hard timeout.
+
+    A timed-out future doesn't cancel the call - the hung RPC keeps
+    occupying the single worker, and every later call would queue behind it
+    and time out without ever reaching MT5. So on timeout the executor is
+    abandoned (no wait) and replaced with a fresh one.
+    """
+    global _MT5_EXECUTOR
+    with _MT5_EXECUTOR_LOCK:
+        executor = _MT5_EXECUTOR
+    try:
+        return executor.submit(func, *args, **kwargs).result(timeout=MT5_CALL_TIMEOUT)
+    except FuturesTimeoutError:
+        with _MT5_EXECUTOR_LOCK:
+            if _MT5_EXECUTOR is executor:
+                executor.shutdown(wait=False)
+                _MT5_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+        logger.error(
+            f"MT5 call {getattr(func, '__name__', func)} timed out after "
+            f"{MT5_CALL_TIMEOUT}s; replaced the RPC worker - the terminal may be wedged"
+        )
+        raise
+
+# Local incremental-sync state: remembers the newest closed-deal time per
+# login so a restart (or a transient error) doesn't re-pull the whole
+# 30-day history window on the next cycle
+SYNC_STATE_PATH = os.environ.get('SYNC_STATE_PATH', 'mt5_sync_state')
+STATE_LOCK = threading.Lock()
+
 # ============================================
 # LOGGING SETUP
 # ============================================
@@ -97,61 +174,112 @@ class EncryptionService:
         
         # Decode the Fernet token
         data = base64.urlsafe_b64decode(encrypted_data.encode())
-        
-        # Parse Fernet token format:
+
+        # Parse Fernet token format through a memoryview so the slices below
+        # are views over the decoded buffer instead of intermediate copies:
         # version (1 byte) + timestamp (8 bytes) + IV (16 bytes) + ciphertext + HMAC (32 bytes)
-        version = data[0]
-        timestamp = data[1:9]
-        iv = data[9:25]
-        ciphertext_with_hmac = data[25:]
-        
-        # Last 32 bytes are HMAC, rest is ciphertext
-        ciphertext = ciphertext_with_hmac[:-32]
-        hmac_tag = ciphertext_with_hmac[-32:]
-        
+        mv = memoryview(data)
+        iv = bytes(mv[9:25])
+        ciphertext = bytes(mv[25:-32])
+        hmac_tag = bytes(mv[-32:])
+
+        # Verify the HMAC (over everything except the tag itself) before
+        # touching the ciphertext; compare_digest avoids timing leaks
+        mac = hmac.new(self.signing_key, mv[:-32], hashlib.sha256).digest()
+        if not hmac.compare_digest(mac, hmac_tag):
+            raise Exception("Invalid token: HMAC verification failed")
+
         # Decrypt with AES-128-CBC
         cipher = AES.new(self.encryption_key, AES.MODE_CBC, iv)
         decrypted = unpad(cipher.decrypt(ciphertext), AES.block_size)
-        
+
         return decrypted.decode()
 
 
+# Single shared instance - the key derivation in __init__ only needs to run
+# once per process, not once per decrypted value
+ENC = EncryptionService()
+
+
 # ============================================
 # DATABASE CONNECTION (for inserting trades)
 # ============================================
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, query_cache_size=500)
 Session = sessionmaker(bind=engine)
 
+# Statements built once at import: the text() constructs (and their
+# compiled forms, via the engine's query cache) are reused across every
+# account sync instead of being re-parsed per call
+SELECT_CLOSED_TICKETS_SQL = text("""
+    SELECT mt5_ticket FROM trades
+    WHERE user_id = :uid AND is_closed = true AND mt5_ticket = ANY(:t)
+""")
+
+SELECT_MIN_OPEN_TIME_SQL = text("""
+    SELECT MIN(open_time) FROM trades
+    WHERE user_id = :user_id
+    AND is_closed = false
+    AND trade_source = 'MT5_AUTO'
+""")
+
+SELECT_OPEN_TRADES_SQL = text("""
+    SELECT id, mt5_ticket FROM trades
+    WHERE user_id = :user_id
+    AND is_closed = false
+    AND trade_source = 'MT5_AUTO'
+""")
+
+CLOSE_TRADE_SQL = text("""
+    UPDATE trades SET
+        close_price = :close_price,
+        close_time = :close_time,
+        profit = :profit,
+        commission = :commission,
+        swap = :swap,
+        net_profit = :net_profit,
+        is_closed = true,
+        updated_at = NOW()
+    WHERE id = :trade_id
+""")
+
+MARK_CLOSED_SQL = text("""
+    UPDATE trades SET is_closed = true, updated_at = NOW()
+    WHERE id = :trade_id
+""")
+
 
 # ============================================
 # API FUNCTIONS (for getting accounts with decrypted passwords)
 # ============================================
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One session for every API call: connections are pooled so only the first
+# call per cycle pays the TCP+TLS handshake, retries cover transient 5xx,
+# and the auth header is set once
+SESSION = requests.Session()
+SESSION.mount(API_URL, HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+SESSION.headers["X-VPS-Secret"] = ENCRYPTION_KEY
+
 
 def get_accounts_to_sync() -> List[Dict]:
     """Get all active MT5 accounts that need syncing via API."""
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{API_URL}/api/mt5/vps/accounts",
-            headers={"X-VPS-Secret": ENCRYPTION_KEY},
             timeout=30
         )
         if response.status_code == 200:
-            accounts = response.json()
-            # Convert to expected format
-            result = []
-            for acc in accounts:
-                result.append({
-                    'id': acc['id'],
-                    'user_id': acc['user_id'],
-                    'mt5_login': acc['mt5_login'],
-                    'mt5_password': acc['mt5_password'],  # Already decrypted!
-                    'mt5_server': acc['mt5_server'],
-                    'sync_interval_minutes': acc['sync_interval_minutes'],
-                    'last_sync_at': acc.get('last_sync_at'),
-                    'last_trade_time': acc.get('last_trade_time')
-                })
-            return result
+            # The API already returns the expected shape (passwords come
+            # decrypted), so parse once and skip the per-account dict rebuild
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
         else:
             logger.error(f"API error: {response.status_code} - {response.text}")
             return []
@@ -160,123 +288,202 @@ def get_accounts_to_sync() -> List[Dict]:
         return []
 
 
-def update_sync_status(account_id: int, status: str, message: str, last_trade_time: datetime = None):
-    """Update the sync status for an account via API."""
+def update_sync_status_bulk(statuses: List[Dict]):
+    """Push the status updates for a whole cycle in one POST."""
+    if not statuses:
+        return
     try:
-        payload = {
-            "account_id": account_id,
-            "status": status,
-            "message": message
-        }
-        if last_trade_time:
-            payload["last_trade_time"] = last_trade_time.isoformat()
-        
-        response = requests.post(
-            f"{API_URL}/api/mt5/vps/status",
-            headers={"X-VPS-Secret": ENCRYPTION_KEY, "Content-Type": "application/json"},
-            json=payload,
-            timeout=30
+        response = SESSION.post(
+            f"{API_URL}/api/mt5/vps/status/bulk",
+            json=statuses,
+            # Scale the timeout with the batch size
+            timeout=10 + 0.05 * len(statuses)
         )
         if response.status_code != 200:
-            logger.error(f"Failed to update status: {response.status_code}")
+            logger.error(f"Failed to update statuses: {response.status_code}")
     except Exception as e:
-        logger.error(f"Failed to update sync status via API: {e}")
+        logger.error(f"Failed to update sync statuses via API: {e}")
 
 
-def insert_trade(user_id: int, trade_data: Dict) -> bool:
-    """Insert a trade into the database. Returns True if inserted, False if exists."""
-    with Session() as session:
-        # Check if trade already exists by MT5 ticket
-        result = session.execute(text("""
-            SELECT id, is_closed FROM trades WHERE user_id = :user_id AND mt5_ticket = :ticket
-        """), {'user_id': user_id, 'ticket': str(trade_data['ticket'])})
-        
-        existing = result.fetchone()
-        if existing:
-            trade_id, was_closed = existing
-            # If trade exists and is now closed but wasn't before, UPDATE it
-            if trade_data.get('is_closed') and not was_closed:
-                session.execute(text("""
-                    UPDATE trades SET
-                        close_price = :close_price,
-                        close_time = :close_time,
-                        profit = :profit,
-                        commission = :commission,
-                        swap = :swap,
-                        net_profit = :net_profit,
-                        is_closed = :is_closed,
-                        updated_at = NOW()
-                    WHERE id = :trade_id
-                """), {
-                    'trade_id': trade_id,
-                    'close_price': trade_data.get('close_price'),
-                    'close_time': trade_data.get('close_time'),
-                    'profit': trade_data.get('profit', 0),
-                    'commission': trade_data.get('commission', 0),
-                    'swap': trade_data.get('swap', 0),
-                    'net_profit': trade_data.get('net_profit', 0),
-                    'is_closed': True
-                })
-                session.commit()
-                logger.info(f"Updated closed trade: {trade_data['ticket']}")
-                return True
-            # If still open, update current profit/price
-            elif not trade_data.get('is_closed') and not was_closed:
-                session.execute(text("""
-                    UPDATE trades SET
-                        close_price = :close_price,
-                        profit = :profit,
-                        swap = :swap,
-                        net_profit = :net_profit,
-                        stop_loss = :stop_loss,
-                        take_profit = :take_profit,
-                        updated_at = NOW()
-                    WHERE id = :trade_id
-                """), {
-                    'trade_id': trade_id,
-                    'close_price': trade_data.get('close_price'),
-                    'profit': trade_data.get('profit', 0),
-                    'swap': trade_data.get('swap', 0),
-                    'net_profit': trade_data.get('net_profit', 0),
-                    'stop_loss': trade_data.get('stop_loss'),
-                    'take_profit': trade_data.get('take_profit')
-                })
-                session.commit()
-            return False  # Not a new trade
-        
-        # Insert new trade
-        session.execute(text("""
-            INSERT INTO trades (
-                user_id, mt5_ticket, trade_source, symbol, trade_type, volume,
-                open_price, close_price, stop_loss, take_profit,
-                open_time, close_time, profit, commission, swap, net_profit,
-                is_closed, created_at
-            ) VALUES (
-                :user_id, :mt5_ticket, 'MT5_AUTO', :symbol, :trade_type, :volume,
-                :open_price, :close_price, :stop_loss, :take_profit,
-                :open_time, :close_time, :profit, :commission, :swap, :net_profit,
-                :is_closed, NOW()
-            )
-        """), {
-            'user_id': user_id,
-            'mt5_ticket': str(trade_data['ticket']),
-            'symbol': trade_data['symbol'],
-            'trade_type': trade_data['trade_type'],
-            'volume': trade_data['volume'],
-            'open_price': trade_data['open_price'],
-            'close_price': trade_data.get('close_price'),
-            'stop_loss': trade_data.get('stop_loss'),
-            'take_profit': trade_data.get('take_profit'),
-            'open_time': trade_data['open_time'],
-            'close_time': trade_data.get('close_time'),
-            'profit': trade_data.get('profit', 0),
-            'commission': trade_data.get('commission', 0),
-            'swap': trade_data.get('swap', 0),
-            'net_profit': trade_data.get('net_profit', 0),
-            'is_closed': trade_data.get('is_closed', False)
-        })
-        session.commit()
-        return True
+# One upsert statement for the whole batch: new tickets are inserted, rows
+# still open in the DB get their latest prices/profit (or their close), and
+# already-closed rows are left untouched. Requires the unique index on
+# (user_id, mt5_ticket).
+INSERT_TRADES_SQL = text("""
+    INSERT INTO trades (
+        user_id, mt5_ticket, trade_source, symbol, trade_type, volume,
+        open_price, close_price, stop_loss, take_profit,
+        open_time, close_time, profit, commission, swap, net_profit,
+        is_closed, created_at
+    ) VALUES (
+        :user_id, :mt5_ticket, 'MT5_AUTO', :symbol, :trade_type, :volume,
+        :open_price, :close_price, :stop_loss, :take_profit,
+        :open_time, :close_time, :profit, :commission, :swap, :net_profit,
+        :is_closed, NOW()
+    )
+    ON CONFLICT (user_id, mt5_ticket) DO UPDATE SET
+        close_price = EXCLUDED.close_price,
+        close_time = EXCLUDED.close_time,
+        stop_loss = EXCLUDED.stop_loss,
+        take_profit = EXCLUDED.take_profit,
+        profit = EXCLUDED.profit,
+        commission = EXCLUDED.commission,
+        swap = EXCLUDED.swap,
+        net_profit = EXCLUDED.net_profit,
+        is_closed = EXCLUDED.is_closed,
+        updated_at = NOW()
+    WHERE trades.is_closed = false
+""")
+
+
+def get_cached_last_deal(login: int) -> Optional[datetime]:
+    """Newest closed-deal time already synced for this login, if known."""
+    with STATE_LOCK:
+        try:
+            with shelve.open(SYNC_STATE_PATH) as state:
+                value = state.get(str(login))
+        except Exception as e:
+            logger.warning(f"Could not read sync state: {e}")
+            return None
+    return datetime.fromisoformat(value) if value else None
+
+
+def set_cached_last_deal(login: int, last_deal_time: datetime):
+    """Record the newest closed-deal time for this login."""
+    with STATE_LOCK:
+        try:
+            with shelve.open(SYNC_STATE_PATH) as state:
+                state[str(login)] = last_deal_time.isoformat()
+        except Exception as e:
+            logger.warning(f"Could not write sync state: {e}")
+
+
+def get_closed_tickets(session, user_id: int, tickets: List[str]) -> set:
+    """Return which of the given tickets are already stored as closed.
+
+    One set-membership query replaces the per-deal existence SELECTs the
+    old insert path used to issue.
+    """
+    if not tickets:
+        return set()
+    result = session.execute(SELECT_CLOSED_TICKETS_SQL, {'uid': user_id, 't': tickets})
+    return {row[0] for row in result}
+
+
+# Above this many rows (a cold-start backfill), COPY into a stage table
+# beats even a batched INSERT
+COPY_THRESHOLD = 500
+
+STAGE_COLUMNS = (
+    'user_id', 'mt5_ticket', 'symbol', 'trade_type', 'volume',
+    'open_price', 'close_price', 'stop_loss', 'take_profit',
+    'open_time', 'close_time', 'profit', 'commission', 'swap',
+    'net_profit', 'is_closed'
+)
+
+
+def copy_upsert(session, rows: List[Dict]):
+    """COPY the rows into a temp stage table, then upsert from it."""
+    session.execute(text("""
+        CREATE TEMP TABLE trades_stage (
+            user_id INTEGER,
+            mt5_ticket TEXT,
+            symbol TEXT,
+            trade_type TEXT,
+            volume DOUBLE PRECISION,
+            open_price DOUBLE PRECISION,
+            close_price DOUBLE PRECISION,
+            stop_loss DOUBLE PRECISION,
+            take_profit DOUBLE PRECISION,
+            open_time TIMESTAMPTZ,
+            close_time TIMESTAMPTZ,
+            profit DOUBLE PRECISION,
+            commission DOUBLE PRECISION,
+            swap DOUBLE PRECISION,
+            net_profit DOUBLE PRECISION,
+            is_closed BOOLEAN
+        ) ON COMMIT DROP
+    """))
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow(['' if row[col] is None else row[col] for col in STAGE_COLUMNS])
+    buf.seek(0)
+
+    # pg8000 exposes COPY through the raw cursor's stream argument
+    cursor = session.connection().connection.cursor()
+    cursor.execute(
+        "COPY trades_stage ({}) FROM STDIN WITH (FORMAT CSV, NULL '')".format(
+            ", ".join(STAGE_COLUMNS)),
+        stream=buf
+    )
+
+    session.execute(text("""
+        INSERT INTO trades (
+            user_id, mt5_ticket, trade_source, symbol, trade_type, volume,
+            open_price, close_price, stop_loss, take_profit,
+            open_time, close_time, profit, commission, swap, net_profit,
+            is_closed, created_at
+        )
+        SELECT
+            user_id, mt5_ticket, 'MT5_AUTO', symbol, trade_type, volume,
+            open_price, close_price, stop_loss, take_profit,
+            open_time, close_time, profit, commission, swap, net_profit,
+            is_closed, NOW()
+        FROM trades_stage
+        ON CONFLICT (user_id, mt5_ticket) DO UPDATE SET
+            close_price = EXCLUDED.close_price,
+            close_time = EXCLUDED.close_time,
+            stop_loss = EXCLUDED.stop_loss,
+            take_profit = EXCLUDED.take_profit,
+            profit = EXCLUDED.profit,
+            commission = EXCLUDED.commission,
+            swap = EXCLUDED.swap,
+            net_profit = EXCLUDED.net_profit,
+            is_closed = EXCLUDED.is_closed,
+            updated_at = NOW()
+        WHERE trades.is_closed = false
+    """))
+
+
+def insert_trades(session, user_id: int, trade_list: List[Dict]) -> int:
+    """Bulk-upsert a batch of trades in one executemany round-trip.
+
+    Replaces the old per-deal SELECT-then-INSERT/UPDATE, which cost two
+    round-trips for every deal in the account's history. Runs on the
+    caller's session; committing is the caller's job.
+    Returns the number of rows written.
+    """
+    if not trade_list:
+        return 0
+
+    rows = [{
+        'user_id': user_id,
+        'mt5_ticket': str(trade_data['ticket']),
+        'symbol': trade_data['symbol'],
+        'trade_type': trade_data['trade_type'],
+        'volume': trade_data['volume'],
+        'open_price': trade_data['open_price'],
+        'close_price': trade_data.get('close_price'),
+        'stop_loss': trade_data.get('stop_loss'),
+        'take_profit': trade_data.get('take_profit'),
+        'open_time': trade_data['open_time'],
+        'close_time': trade_data.get('close_time'),
+        'profit': trade_data.get('profit', 0),
+        'commission': trade_data.get('commission', 0),
+        'swap': trade_data.get('swap', 0),
+        'net_profit': trade_data.get('net_profit', 0),
+        'is_closed': trade_data.get('is_closed', False)
+    } for trade_data in trade_list]
+
+    if len(rows) > COPY_THRESHOLD:
+        copy_upsert(session, rows)
+        return len(rows)
+
+    result = session.execute(INSERT_TRADES_SQL, rows)
+    # Some drivers report -1 for executemany; fall back to the batch size
+    return result.rowcount if result.rowcount >= 0 else len(rows)
 
 
 def sync_account(account: Dict) -> Tuple[bool, str, int]:
@@ -295,229 +502,276 @@ def sync_account(account: Dict) -> Tuple[bool, str, int]:
         server = account['mt5_server']
         
         logger.info(f"Connecting to MT5 for user {account['user_id']} (login: {login})")
-        
-        if not mt5.initialize():
-            return False, f"MT5 initialization failed: {mt5.last_error()}", 0
-        
-        if not mt5.login(login, password=password, server=server):
-            error = mt5.last_error()
-            mt5.shutdown()
-            return False, f"Login failed: {error}", 0
-        
-        logger.info(f"Successfully logged in to {login}@{server}")
-        
-        account_info = mt5.account_info()
-        if not account_info:
-            mt5.shutdown()
-            return False, "Could not get account info", 0
-        
-        trades_synced = 0
-        
+
         # ============================================
         # STEP 1: Get ALL closed trades from history
-        # Use last 30 days to get recent trades
+        # Use last 30 days to get recent trades, or just the window since
+        # the last deal we've seen (with a 30-minute overlap for safety)
         # ============================================
-        from_date = datetime.now(timezone.utc) - timedelta(days=30)
-        to_date = datetime.now(timezone.utc) + timedelta(days=1)
-        
-        deals = mt5.history_deals_get(from_date, to_date)
-        
-        # Build a map: position_id -> {entry_deal, exit_deal}
-        position_deals = {}
-        
-        if deals:
-            logger.info(f"Found {len(deals)} total deals in history")
-            
-            for deal in deals:
-                # Skip non-trade deals (balance, credit, etc.)
-                # type: 0=BUY, 1=SELL, 2=BALANCE, etc.
-                if deal.type > 1:
-                    continue
-                
-                pos_id = deal.position_id
-                if pos_id == 0:
-                    continue  # Skip invalid position IDs
-                
-                if pos_id not in position_deals:
-                    position_deals[pos_id] = {'entry': None, 'exit': None}
-                
-                # entry: 0=IN, 1=OUT, 2=INOUT, 3=OUT_BY
-                if deal.entry == 0:  # DEAL_ENTRY_IN - Opening
-                    position_deals[pos_id]['entry'] = deal
-                elif deal.entry == 1:  # DEAL_ENTRY_OUT - Closing
-                    position_deals[pos_id]['exit'] = deal
-        
+        now = datetime.now(timezone.utc)
+        from_date = now - timedelta(days=30)
+        cached_last_deal = get_cached_last_deal(login)
+
+        # One pre-lock DB round-trip serves two purposes: the oldest open
+        # row clamps the shrunk history window (below), and its existence
+        # gates the quiet-account fast path inside the lock - keeping the
+        # network wait outside the serialized terminal phase
+        with Session() as session:
+            oldest_open = session.execute(
+                SELECT_MIN_OPEN_TIME_SQL, {'user_id': account['user_id']}
+            ).scalar()
+        db_has_open = oldest_open is not None
+
+        if cached_last_deal:
+            # The shrunk window must still reach back to the entry deal of
+            # every position that's still open: STEP 2 joins entries to
+            # exits, and a close whose DEAL_ENTRY_IN fell before from_date
+            # would be flipped closed with no P&L ever written
+            window_start = cached_last_deal - timedelta(minutes=30)
+            if db_has_open:
+                window_start = min(window_start, oldest_open - timedelta(minutes=30))
+            from_date = max(from_date, window_start)
+        to_date = now + timedelta(days=1)
+
+        # The MT5 terminal is process-global and already initialized in
+        # main(); switching accounts only needs a login. Only the terminal
+        # phase is serialized - the API/DB work below overlaps across workers
+        with MT5_LOCK:
+            # login is the RPC most likely to hang (dead broker server), and
+            # it runs under the global lock - bound it like the rest
+            if not mt5_call(mt5.login, login, password=password, server=server):
+                return False, f"Login failed: {mt5.last_error()}", 0
+
+            logger.info(f"Successfully logged in to {login}@{server}")
+
+            account_info = mt5_call(mt5.account_info)
+            if not account_info:
+                return False, "Could not get account info", 0
+
+            # Quiet-account fast path: a count RPC is far cheaper than
+            # marshalling the whole deal history, so accounts with nothing
+            # new and nothing open cost O(1) per cycle. Only safe when the
+            # DB agrees nothing is open (checked before the lock) - a
+            # position closed outside the 30-day window shows zero deals
+            # here, and skipping would leave its row open forever; falling
+            # through lets STEP 4 close it
+            if (not db_has_open
+                    and mt5_call(mt5.history_deals_total, from_date, to_date) == 0
+                    and not mt5_call(mt5.positions_get)):
+                logger.info(f"User {account['user_id']}: no new activity")
+                return True, "No new activity", 0
+
+            deals = mt5_call(mt5.history_deals_get, from_date, to_date, group=DEALS_GROUP)
+            open_positions = mt5_call(mt5.positions_get)
+
+        trades_synced = 0
+        all_trades = []
+
         # ============================================
         # STEP 2: Process CLOSED positions
-        # A position is closed if it has both entry AND exit
+        # Grouping happens in pandas: filter the trade deals once, split into
+        # entry/exit frames and join on position_id in vectorized C code
+        # instead of a Python dict loop over every deal
         # ============================================
-        closed_position_ids = set()
-        
-        for pos_id, deals_info in position_deals.items():
-            entry = deals_info['entry']
-            exit_deal = deals_info['exit']
-            
-            if entry and exit_deal:
-                closed_position_ids.add(str(pos_id))
-                
+        closed_by_ticket = {}
+
+        if deals:
+            logger.info(f"Found {len(deals)} total deals in history")
+
+            df = pd.DataFrame(list(deals), columns=deals[0]._asdict().keys())
+            # Keep BUY/SELL deals (type 0/1) with a valid position id
+            df = df[(df['type'] <= 1) & (df['position_id'] != 0)].copy()
+
+            # One vectorized conversion instead of datetime.fromtimestamp
+            # (tz lookup + allocation) twice per position in the row loop
+            df['dt'] = pd.to_datetime(df['time'], unit='s', utc=True)
+
+            # entry: 0=IN (opening deal), 1=OUT (closing deal)
+            entry_df = df[df['entry'] == 0].drop_duplicates('position_id', keep='first').set_index('position_id')
+            exit_df = df[df['entry'] == 1].drop_duplicates('position_id', keep='last').set_index('position_id')
+
+            # A position is closed if it has both entry AND exit
+            joined = entry_df.join(exit_df, lsuffix='_e', rsuffix='_x', how='inner')
+
+            for pos_id, row in joined.iterrows():
                 # The EXIT deal contains the correct final profit!
                 trade_data = {
-                    'ticket': pos_id,
-                    'symbol': entry.symbol,
-                    'trade_type': 'BUY' if entry.type == 0 else 'SELL',
-                    'volume': entry.volume,
-                    'open_price': entry.price,
-                    'close_price': exit_deal.price,
+                    'ticket': int(pos_id),
+                    'symbol': row['symbol_e'],
+                    'trade_type': 'BUY' if int(row['type_e']) == 0 else 'SELL',
+                    'volume': float(row['volume_e']),
+                    'open_price': float(row['price_e']),
+                    'close_price': float(row['price_x']),
                     'stop_loss': None,
                     'take_profit': None,
-                    'open_time': datetime.fromtimestamp(entry.time, tz=timezone.utc),
-                    'close_time': datetime.fromtimestamp(exit_deal.time, tz=timezone.utc),
-                    'profit': exit_deal.profit,  # Final profit is on exit deal!
-                    'commission': entry.commission + exit_deal.commission,
-                    'swap': getattr(exit_deal, 'swap', 0),
-                    'net_profit': exit_deal.profit + entry.commission + exit_deal.commission + getattr(exit_deal, 'swap', 0),
+                    'open_time': row['dt_e'].to_pydatetime(),
+                    'close_time': row['dt_x'].to_pydatetime(),
+                    'profit': float(row['profit_x']),
+                    'commission': float(row['commission_e'] + row['commission_x']),
+                    'swap': float(row['swap_x']),
+                    'net_profit': float(row['profit_x'] + row['commission_e'] + row['commission_x'] + row['swap_x']),
                     'is_closed': True
                 }
-                
-                if insert_trade(account['user_id'], trade_data):
-                    trades_synced += 1
-                    logger.info(f"Synced closed: {entry.symbol} profit={exit_deal.profit}")
-        
-        logger.info(f"Processed {len(closed_position_ids)} closed positions")
+
+                closed_by_ticket[str(int(pos_id))] = trade_data
+                all_trades.append(trade_data)
+
+        logger.info(f"Processed {len(closed_by_ticket)} closed positions")
         
         # ============================================
         # STEP 3: Process OPEN positions
         # ============================================
-        open_positions = mt5.positions_get()
         open_tickets = set()
-        
+
         if open_positions:
             logger.info(f"Found {len(open_positions)} open positions")
-            
-            for pos in open_positions:
-                open_tickets.add(str(pos.ticket))
-                
-                trade_data = {
-                    'ticket': pos.ticket,
-                    'symbol': pos.symbol,
-                    'trade_type': 'BUY' if pos.type == 0 else 'SELL',
-                    'volume': pos.volume,
-                    'open_price': pos.price_open,
-                    'close_price': pos.price_current,
-                    'stop_loss': pos.sl if pos.sl > 0 else None,
-                    'take_profit': pos.tp if pos.tp > 0 else None,
-                    'open_time': datetime.fromtimestamp(pos.time, tz=timezone.utc),
-                    'close_time': None,
-                    'profit': pos.profit,
-                    'commission': 0,
-                    'swap': pos.swap,
-                    'net_profit': pos.profit + pos.swap,
-                    'is_closed': False
-                }
-                
-                if insert_trade(account['user_id'], trade_data):
-                    trades_synced += 1
-                    logger.info(f"Synced open: {pos.symbol} current_profit={pos.profit}")
-        
-        # ============================================
-        # STEP 4: Update trades that were open but now closed
-        # ============================================
+
+            # Same column-wise treatment as the deals: one DataFrame, masks
+            # and conversions computed per column, and Python dicts only
+            # materialized at the insert boundary. Every open position is
+            # shipped each cycle - the upsert's conflict clause is what
+            # refreshes current price/profit/swap/SL/TP on open rows, and
+            # it all rides in the same executemany anyway
+            pos_df = pd.DataFrame(list(open_positions), columns=open_positions[0]._asdict().keys())
+            pos_df['ticket_str'] = pos_df['ticket'].astype(str)
+            open_tickets = set(pos_df['ticket_str'])
+
+            if len(pos_df):
+                # Zero SL/TP means unset
+                sl_col = pos_df['sl'].where(pos_df['sl'] > 0)
+                tp_col = pos_df['tp'].where(pos_df['tp'] > 0)
+                open_dt = pd.to_datetime(pos_df['time'], unit='s', utc=True)
+                net_col = pos_df['profit'] + pos_df['swap']
+
+                for ticket, symbol, pos_type, volume, price_open, price_current, sl, tp, odt, profit, swap, net in zip(
+                        pos_df['ticket'], pos_df['symbol'], pos_df['type'], pos_df['volume'],
+                        pos_df['price_open'], pos_df['price_current'], sl_col, tp_col, open_dt,
+                        pos_df['profit'], pos_df['swap'], net_col):
+                    all_trades.append({
+                        'ticket': int(ticket),
+                        'symbol': symbol,
+                        'trade_type': 'BUY' if int(pos_type) == 0 else 'SELL',
+                        'volume': float(volume),
+                        'open_price': float(price_open),
+                        'close_price': float(price_current),
+                        'stop_loss': None if pd.isna(sl) else float(sl),
+                        'take_profit': None if pd.isna(tp) else float(tp),
+                        'open_time': odt.to_pydatetime(),
+                        'close_time': None,
+                        'profit': float(profit),
+                        'commission': 0,
+                        'swap': float(swap),
+                        'net_profit': float(net),
+                        'is_closed': False
+                    })
+
+        # One Session covers the whole account's DB work: one connection
+        # checkout and one commit instead of a transaction per statement
         with Session() as session:
-            result = session.execute(text("""
-                SELECT id, mt5_ticket FROM trades 
-                WHERE user_id = :user_id 
-                AND is_closed = false 
-                AND trade_source = 'MT5_AUTO'
-            """), {'user_id': account['user_id']})
+            # Skip tickets the DB already has as closed - the upsert would
+            # ignore those rows anyway, so don't build or ship them
+            closed_in_db = get_closed_tickets(
+                session, account['user_id'], [str(t['ticket']) for t in all_trades])
+            if closed_in_db:
+                all_trades = [t for t in all_trades if str(t['ticket']) not in closed_in_db]
+
+            # One bulk upsert for everything gathered above instead of a
+            # round-trip per deal
+            trades_synced = insert_trades(session, account['user_id'], all_trades)
+            logger.info(f"Upserted {trades_synced} trades in one batch")
+
+            # ============================================
+            # STEP 4: Update trades that were open but now closed
+            # ============================================
+            result = session.execute(SELECT_OPEN_TRADES_SQL, {'user_id': account['user_id']})
             
             for row in result:
                 trade_id, ticket = row
                 # If not in current open positions, it must have closed
                 if ticket not in open_tickets:
                     # Check if we have the closed data
-                    if ticket in closed_position_ids:
-                        pos_data = position_deals.get(int(ticket))
-                        if pos_data and pos_data['exit']:
-                            exit_d = pos_data['exit']
-                            entry_d = pos_data['entry']
-                            session.execute(text("""
-                                UPDATE trades SET
-                                    close_price = :close_price,
-                                    close_time = :close_time,
-                                    profit = :profit,
-                                    commission = :commission,
-                                    swap = :swap,
-                                    net_profit = :net_profit,
-                                    is_closed = true,
-                                    updated_at = NOW()
-                                WHERE id = :trade_id
-                            """), {
-                                'trade_id': trade_id,
-                                'close_price': exit_d.price,
-                                'close_time': datetime.fromtimestamp(exit_d.time, tz=timezone.utc),
-                                'profit': exit_d.profit,
-                                'commission': entry_d.commission + exit_d.commission if entry_d else exit_d.commission,
-                                'swap': getattr(exit_d, 'swap', 0),
-                                'net_profit': exit_d.profit + (entry_d.commission if entry_d else 0) + exit_d.commission + getattr(exit_d, 'swap', 0)
-                            })
-                            logger.info(f"Updated trade {ticket} -> closed, profit={exit_d.profit}")
-                            trades_synced += 1
+                    closed_data = closed_by_ticket.get(ticket)
+                    if closed_data:
+                        session.execute(CLOSE_TRADE_SQL, {
+                            'trade_id': trade_id,
+                            'close_price': closed_data['close_price'],
+                            'close_time': closed_data['close_time'],
+                            'profit': closed_data['profit'],
+                            'commission': closed_data['commission'],
+                            'swap': closed_data['swap'],
+                            'net_profit': closed_data['net_profit']
+                        })
+                        logger.info(f"Updated trade {ticket} -> closed, profit={closed_data['profit']}")
+                        trades_synced += 1
                     else:
                         # Just mark as closed without details
-                        session.execute(text("""
-                            UPDATE trades SET is_closed = true, updated_at = NOW()
-                            WHERE id = :trade_id
-                        """), {'trade_id': trade_id})
+                        session.execute(MARK_CLOSED_SQL, {'trade_id': trade_id})
                         logger.info(f"Marked trade {ticket} as closed (no history found)")
-                    
-                    session.commit()
-        
-        mt5.shutdown()
-        
+
+            session.commit()
+
+        # Advance the incremental window for the next cycle
+        if closed_by_ticket:
+            set_cached_last_deal(
+                login, max(t['close_time'] for t in closed_by_ticket.values()))
+
         message = f"Synced {trades_synced} trades"
         logger.info(f"User {account['user_id']}: {message}")
-        
+
         return True, message, trades_synced
-        
+
     except Exception as e:
         logger.error(f"Error syncing account {account['user_id']}: {e}")
         logger.error(traceback.format_exc())
-        try:
-            mt5.shutdown()
-        except:
-            pass
         return False, f"Error: {str(e)}", 0
 
 
+def process_account(account: Dict) -> Dict:
+    """Sync one account and return its status record for the bulk update."""
+    try:
+        logger.info(f"Processing account ID {account['id']} (user {account['user_id']})")
+
+        success, message, trades_synced = sync_account(account)
+
+        return {
+            "account_id": account['id'],
+            "status": 'success' if success else 'error',
+            "message": message,
+            "last_trade_time": datetime.now(timezone.utc).isoformat() if trades_synced > 0 else None
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to sync account {account['id']}: {e}")
+        return {
+            "account_id": account['id'],
+            "status": 'error',
+            "message": str(e),
+            "last_trade_time": None
+        }
+
+
 def run_sync_cycle():
     """Run one complete sync cycle for all accounts."""
     accounts = get_accounts_to_sync()
-    
+
     if not accounts:
         logger.debug("No accounts need syncing")
         return
-    
+
     logger.info(f"Found {len(accounts)} accounts to sync")
-    
-    for account in accounts:
-        try:
-            logger.info(f"Processing account ID {account['id']} (user {account['user_id']})")
-            
-            success, message, trades_synced = sync_account(account)
-            
-            update_sync_status(
-                account['id'],
-                'success' if success else 'error',
-                message,
-                datetime.now(timezone.utc) if trades_synced > 0 else None
-            )
-            
-            # Small delay between accounts to be safe
-            time.sleep(2)
-            
-        except Exception as e:
-            logger.error(f"Failed to sync account {account['id']}: {e}")
-            update_sync_status(account['id'], 'error', str(e))
+
+    if len(accounts) == 1:
+        # One account due: skip the pool overhead and run it inline
+        statuses = [process_account(accounts[0])]
+    else:
+        # Terminal access is serialized by MT5_LOCK, but each account's
+        # database writes overlap with the next account's MT5 phase, and
+        # the fixed 2s inter-account stall is gone
+        with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+            statuses = list(pool.map(process_account, accounts))
+
+    # One POST for the whole cycle instead of a status round-trip per account
+    update_sync_status_bulk(statuses)
 
 
 def main():
@@ -528,25 +782,33 @@ def main():
     logger.info(f"Database: {DATABASE_URL[:50]}...")
     logger.info(f"Sync check interval: {SYNC_CHECK_INTERVAL} seconds")
     
-    # Test MT5 initialization
+    # Initialize the terminal once for the whole process - terminal startup
+    # takes seconds, and switching accounts only needs mt5.login
     if not mt5.initialize():
         logger.error(f"MT5 initialization failed: {mt5.last_error()}")
         logger.error("Make sure MT5 terminal is installed")
         sys.exit(1)
+
+    atexit.register(mt5.shutdown)
+    logger.info("MT5 terminal initialized")
     
-    mt5.shutdown()
-    logger.info("MT5 terminal found and working")
-    
-    # Main loop
+    # Main loop - adaptive sleep: cycle time eats into the interval instead
+    # of adding to it, smoothed with an EMA so one slow cycle doesn't whipsaw
+    cycle_ema = 0.0
     while True:
+        started = time.monotonic()
         try:
             run_sync_cycle()
         except Exception as e:
             logger.error(f"Error in sync cycle: {e}")
             logger.error(traceback.format_exc())
-        
-        logger.debug(f"Sleeping for {SYNC_CHECK_INTERVAL} seconds...")
-        time.sleep(SYNC_CHECK_INTERVAL)
+
+        elapsed = time.monotonic() - started
+        cycle_ema = elapsed if cycle_ema == 0 else 0.3 * elapsed + 0.7 * cycle_ema
+        sleep_for = max(MIN_SYNC_SLEEP, SYNC_CHECK_INTERVAL - cycle_ema)
+
+        logger.debug(f"Cycle took {elapsed:.1f}s; sleeping for {sleep_for:.1f} seconds...")
+        time.sleep(sleep_for)
 
 
 if __name__ == "__main__":